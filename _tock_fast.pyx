@@ -0,0 +1,32 @@
+# cython: language_level=3
+"""
+Optional Cython fast path for the hot frame builders in tock.py
+
+Compiled lazily via pyximport when Cython is installed; tock.py falls back
+to the pure-Python builders when it is not. The lookup tables are built
+once in tock.py and handed over through init() so the two paths can never
+disagree on the rendered output.
+"""
+
+cdef list _hms = []
+cdef tuple _rows = ()
+cdef tuple _glyphs = ()
+cdef dict _glyph_idx = {}
+
+
+def init(hms, rows, glyphs, glyph_idx):
+    """Adopt the render tables built at import time by tock.py"""
+    global _hms, _rows, _glyphs, _glyph_idx
+    _hms = hms
+    _rows = tuple(rows)
+    _glyphs = tuple(glyphs)
+    _glyph_idx = dict(glyph_idx)
+
+
+cpdef list draw_digital(int h, int m, int s):
+    """Compiled equivalent of TockClock.draw_digital_clock"""
+    cdef str time_str = _hms[h][m][s]
+    cdef list idxs = [_glyph_idx[c] for c in time_str]
+    cdef int i
+    return ['  '.join([_rows[_glyphs[k][i]] for k in idxs]) + '  '
+            for i in range(6)]
@@ -0,0 +1,36 @@
+"""
+Packaging for Tock
+
+When mypyc is available at build time, tock.py is compiled to a C extension
+for faster startup; otherwise this is a normal pure-Python install.
+"""
+
+from setuptools import setup
+
+ext_modules = []
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    pass
+else:
+    try:
+        ext_modules = mypycify(['tock.py'])
+    except (Exception, SystemExit) as exc:
+        # mypyc rejecting the module must never break a plain install
+        print(f'mypyc compilation skipped ({exc}); installing pure Python')
+        ext_modules = []
+
+setup(
+    name='tock',
+    version='1.0.0',
+    description='A modern TUI clock application',
+    py_modules=['tock'],
+    ext_modules=ext_modules,
+    python_requires='>=3.6',
+    install_requires=[
+        'windows-curses>=2.3.0; platform_system == "Windows"',
+    ],
+    entry_points={
+        'console_scripts': ['tock = tock:main'],
+    },
+)